@@ -67,6 +67,7 @@ def run(
     config_override_strings: List[str],
     _force_run_dir: Optional[str],
     design_dir: Optional[str],
+    use_cache: bool = False,
     view_save_path: Optional[str] = None,
     ef_view_save_path: Optional[str] = None,
 ):
@@ -142,6 +143,7 @@ def run(
             skip=skip,
             with_initial_state=with_initial_state,
             reproducible=reproducible,
+            use_cache=use_cache,
             _force_run_dir=_force_run_dir,
         )
     except FlowException as e:
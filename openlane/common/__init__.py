@@ -55,5 +55,5 @@ from .types import (
 from .toolbox import Toolbox
 from .drc import DRC, Violation
 from . import cli
-from .tpe import get_tpe, set_tpe
+from .tpe import get_tpe, set_tpe, shutdown_tpe
 from .ring_buffer import RingBuffer
@@ -16,9 +16,9 @@ import re
 import glob
 import typing
 import fnmatch
-import pathlib
 import unicodedata
 from math import inf
+from functools import lru_cache
 from typing import (
     Any,
     Generator,
@@ -105,6 +105,7 @@ def get_opdks_rev() -> str:
 # ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+@lru_cache(maxsize=256)
 def slugify(value: str, lower: bool = False) -> str:
     """
     :param value: Input string
@@ -177,7 +178,7 @@ def mkdirp(path: typing.Union[str, os.PathLike]):
 
     :param path: A filesystem path for the directory
     """
-    return pathlib.Path(path).mkdir(parents=True, exist_ok=True)
+    os.makedirs(path, exist_ok=True)
 
 
 class zip_first(object):
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import threading
+from typing import Optional
 
 from concurrent.futures import ThreadPoolExecutor
 
-TPE = ThreadPoolExecutor(max_workers=os.cpu_count())
+TPE: Optional[ThreadPoolExecutor] = None
+TPE_LOCK = threading.Lock()
 
 
 def set_tpe(tpe: ThreadPoolExecutor):
@@ -29,13 +32,36 @@ def set_tpe(tpe: ThreadPoolExecutor):
     :param tpe: The replacement ThreadPoolExecutor
     """
     global TPE
-    TPE = tpe
+    with TPE_LOCK:
+        TPE = tpe
 
 
 def get_tpe() -> ThreadPoolExecutor:
     """
+    The executor is created on first use with ``os.cpu_count()`` workers,
+    unless replaced beforehand using :func:`set_tpe`, and is shared by all
+    flows in the process.
+
     :returns: OpenLane's global ``ThreadPoolExecutor``. This is used to run
         steps, so do not use them inside steps to avoid a deadlock.
     """
     global TPE
-    return TPE
+    with TPE_LOCK:
+        if TPE is None:
+            TPE = ThreadPoolExecutor(max_workers=os.cpu_count())
+        return TPE
+
+
+def shutdown_tpe(wait: bool = True):
+    """
+    Shuts down OpenLane's global ``ThreadPoolExecutor``, if it has been created.
+
+    A new one will be created the next time :func:`get_tpe` is called.
+
+    :param wait: Whether to wait for pending tasks to finish before returning
+    """
+    global TPE
+    with TPE_LOCK:
+        tpe, TPE = TPE, None
+    if tpe is not None:
+        tpe.shutdown(wait=wait)
@@ -18,7 +18,7 @@ import dataclasses
 from glob import glob
 from decimal import Decimal
 from textwrap import dedent
-from functools import lru_cache
+from functools import lru_cache, cached_property
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -198,8 +198,15 @@ class Config(GenericImmutableDict[str, Any]):
             final["meta"] = self.meta
         return final
 
+    @cached_property
+    def _dumps_cache(self) -> Dict[Tuple[Any, ...], str]:
+        return {}
+
     def dumps(self, include_meta: bool = True, **kwargs) -> str:
         """
+        As configuration objects are immutable, the serialization is memoized
+        for calls where ``indent`` is the only keyword argument passed (if any.)
+
         :param include_meta: Whether to include the ``meta`` object in the
             serialized string.
         :param kwargs: Passed to ``json.dumps``.
@@ -207,9 +214,24 @@ class Config(GenericImmutableDict[str, Any]):
         """
         if "indent" not in kwargs:
             kwargs["indent"] = 4
-        return json.dumps(
+
+        cache_key: Optional[Tuple[Any, ...]] = None
+        if kwargs.keys() == {"indent"}:
+            # Meta objects are mutable, so they're part of the key
+            meta_tuple = dataclasses.astuple(self.meta) if include_meta else None
+            cache_key = (include_meta, meta_tuple, kwargs["indent"])
+            try:
+                if cached := self._dumps_cache.get(cache_key):
+                    return cached
+            except TypeError:  # Unhashable meta (e.g. list of flows)
+                cache_key = None
+
+        result = json.dumps(
             self.to_raw_dict(include_meta), cls=self.get_encoder(), **kwargs
         )
+        if cache_key is not None:
+            self._dumps_cache[cache_key] = result
+        return result
 
     def copy_filtered(
         self,
@@ -206,6 +206,7 @@ def cloup_flow_opts(
         * ``frm``§: ``Optional[str]``: Start from a step with this ID. Supported by sequential flows.
         * ``to``§: ``Optional[str]``: Stop at a step with this id. Supported by sequential flows.
         * ``skip``§: ``Iterable[str]``: Skip these steps. Supported by sequential flows.
+        * ``use_cache``§: ``bool``: Restore the results of steps with unchanged inputs from a cache. Supported by sequential flows.
     * Sequential flow reproducible (if parameter ``sequential_flow_reproducible`` is ``True``)
         * ``reproducible``§: ``str``: Create a reproducible for a step with is ID, aborting the flow afterwards. Supported by sequential flows.
     * Flow run options (if parameter ``run_options`` is ``True``):
@@ -346,6 +347,12 @@ def cloup_flow_opts(
                     multiple=True,
                     help="Skip these steps. Supported by sequential flows.",
                 ),
+                o(
+                    "--use-cache",
+                    is_flag=True,
+                    default=False,
+                    help="Restore the results of steps whose configuration and inputs are unchanged from a previous run, which are cached in the 'runs/.cache' directory of the design. The cache is not invalidated when the underlying tools are updated. Supported by sequential flows.",
+                ),
             )(f)
         if sequential_flow_reproducible:
             f = o(
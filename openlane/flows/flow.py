@@ -13,17 +13,21 @@
 # limitations under the License.
 from __future__ import annotations
 import os
+import sys
+import time
 import glob
 import shutil
 import fnmatch
 import logging
-import datetime
 import textwrap
+import threading
+from collections import deque
 from dataclasses import dataclass
 from abc import abstractmethod, ABC
-from concurrent.futures import Future
+from concurrent.futures import Future, wait
 from functools import wraps
 from typing import (
+    Deque,
     List,
     Sequence,
     Tuple,
@@ -38,6 +42,7 @@ from typing import (
 
 from rich.progress import (
     Progress,
+    ProgressColumn,
     TextColumn,
     BarColumn,
     MofNCompleteColumn,
@@ -131,36 +136,106 @@ class FlowProgressBar(object):
     """
     A wrapper for a flow's progress bar, rendered using Rich at the bottom of
     interactive terminals.
+
+    Stage changes do not update the progress bar directly: they push a
+    snapshot of the progress onto a bounded queue, which is rendered every
+    :attr:`update_interval` seconds by a dedicated thread. Only the latest
+    snapshot is ever rendered, so neither the flow nor the steps it runs wait
+    on Rich.
+
+    :cvar update_interval: The interval, in seconds, at which the renderer
+        thread updates the progress bar.
     """
 
+    update_interval: ClassVar[float] = 0.25
+
+    # None of these columns cache renderables (``max_refresh`` is ``None``),
+    # so they can be shared by all progress bars
+    __columns: ClassVar[Tuple[ProgressColumn, ...]] = (
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+    )
+
     def __init__(self, flow_name: str, starting_ordinal: int = 1) -> None:
         self.__flow_name: str = flow_name
+        self.__stage_description_prefix: str = f"{flow_name} - Stage "
+        self.__description: str = flow_name
         self.__stages_completed: int = 0
         self.__max_stage: int = 0
         self.__task_id: TaskID = TaskID(-1)
         self.__ordinal: int = starting_ordinal
+        self.__ordinal_prefix_format: str = "%d-"
+        self.__updates: Deque[Tuple[str, float, Optional[int]]] = deque(maxlen=64)
+        self.__rendered: Optional[Tuple[str, float, Optional[int]]] = None
+        self.__renderer: Optional[threading.Thread] = None
+        self.__renderer_stop = threading.Event()
+        self.__disabled: bool = not options.get_show_progress_bar()
         self.__progress = Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            TimeElapsedColumn(),
+            *self.__columns,
             console=console,
-            disable=not options.get_show_progress_bar(),
+            refresh_per_second=4,
+            disable=self.__disabled,
         )
 
+    def __post(self):
+        # deque.append is atomic: no locks are taken and Rich is not touched
+        self.__updates.append(
+            (
+                self.__description,
+                float(self.__stages_completed),
+                self.__max_stage or None,
+            )
+        )
+
+    def __render(self):
+        if len(self.__updates) == 0:
+            return
+        latest = self.__updates[-1]
+        if latest is self.__rendered:
+            return
+        description, completed, total = latest
+        self.__progress.update(
+            self.__task_id,
+            description=description,
+            completed=completed,
+            total=total,
+        )
+        self.__rendered = latest
+
+    def __render_loop(self):
+        while not self.__renderer_stop.wait(self.update_interval):
+            self.__render()
+
     def start(self):
         """
         Starts rendering the progress bar.
         """
         self.__progress.start()
         self.__task_id = self.__progress.add_task(
-            f"{self.__flow_name}",
+            self.__flow_name,
+        )
+        if self.__disabled:
+            # Nothing is rendered: end() still updates the task once
+            return
+        self.__renderer_stop.clear()
+        self.__renderer = threading.Thread(
+            target=self.__render_loop,
+            name=f"{self.__flow_name} Progress Bar",
+            daemon=True,
         )
+        self.__renderer.start()
 
     def end(self):
         """
         Stops rendering the progress bar.
         """
+        if renderer := self.__renderer:
+            self.__renderer_stop.set()
+            renderer.join()
+            self.__renderer = None
+        self.__render()
         self.__progress.stop()
         self.__task_id = TaskID(-1)
 
@@ -180,7 +255,8 @@ class FlowProgressBar(object):
         :param count: The total number of stages.
         """
         self.__max_stage = count
-        self.__progress.update(self.__task_id, total=count)
+        self.__ordinal_prefix_format = f"%0{len(str(count))}d-"
+        self.__post()
 
     @ensure_progress_started
     def start_stage(self, name: str):
@@ -189,10 +265,10 @@ class FlowProgressBar(object):
 
         :param name: The name of the stage.
         """
-        self.__progress.update(
-            self.__task_id,
-            description=f"{self.__flow_name} - Stage {self.__stages_completed + 1} - {name}",
+        self.__description = (
+            f"{self.__stage_description_prefix}{self.__stages_completed + 1} - {name}"
         )
+        self.__post()
 
     @ensure_progress_started
     def end_stage(self, *, increment_ordinal: bool = True):
@@ -209,7 +285,7 @@ class FlowProgressBar(object):
         self.__stages_completed += 1
         if increment_ordinal:
             self.__ordinal += 1
-        self.__progress.update(self.__task_id, completed=float(self.__stages_completed))
+        self.__post()
 
     @ensure_progress_started
     def get_ordinal_prefix(self) -> str:
@@ -217,8 +293,7 @@ class FlowProgressBar(object):
         :returns: A string with the current step ordinal, which can be
             used to create a step directory.
         """
-        max_stage_digits = len(str(self.__max_stage))
-        return f"{str(self.__ordinal).zfill(max_stage_digits)}-"
+        return self.__ordinal_prefix_format % self.__ordinal
 
 
 class Flow(ABC):
@@ -268,6 +343,12 @@ class Flow(ABC):
         A list of :class:`Step` **objects** from the last run of the flow,
         if it exists.
 
+        The list is deliberately not windowed: saving views in the Efabless
+        format collects reports from every signoff step of the run. The step
+        directories within :attr:`run_dir` remain the persistent record of the
+        run, and are loaded back using :meth:`Step.load_finished` when a run
+        is resumed.
+
         If :meth:`start` is called again, the reference is destroyed.
 
     :ivar run_dir:
@@ -529,6 +610,13 @@ class Flow(ABC):
         :returns: ``(success, state_list)``
         """
 
+        # References to the previous run are destroyed up front, so they are
+        # not left pointing to a stale run if this one fails to start
+        self.run_dir = None
+        self.step_objects = None
+        self.toolbox = None
+        self.config_resolved_path = None
+
         handlers: List[logging.Handler] = []
 
         warning_handler = Flow._StepWarningHandler()
@@ -539,18 +627,16 @@ class Flow(ABC):
         if last_run and tag is not None:
             raise FlowException("tag and last_run cannot be used simultaneously.")
 
-        tag = tag or datetime.datetime.now().astimezone().strftime(
-            "RUN_%Y-%m-%d_%H-%M-%S"
-        )
+        tag = tag or time.strftime("RUN_%Y-%m-%d_%H-%M-%S", time.localtime())
         if last_run:
             runs = sorted(glob.glob(os.path.join(self.design_dir, "runs", "*")))
 
             latest_time: float = 0
             latest_run: Optional[str] = None
             for run in runs:
-                time = os.path.getmtime(run)
-                if time > latest_time:
-                    latest_time = time
+                mtime = os.path.getmtime(run)
+                if mtime > latest_time:
+                    latest_time = mtime
                     latest_run = run
 
             if latest_run is not None:
@@ -644,10 +730,14 @@ class Flow(ABC):
         handlers.append(handler)
         register_additional_handler(handler)
 
+        config_resolved_future: Optional[Future[None]] = None
         try:
             self.config_resolved_path = os.path.join(self.run_dir, "resolved.json")
-            with open(self.config_resolved_path, "w") as f:
-                f.write(self.config.dumps())
+            config_resolved_future = get_tpe().submit(
+                self.__write_if_changed,
+                self.config_resolved_path,
+                self.config.dumps(),
+            )
 
             self.progress_bar = FlowProgressBar(
                 self.name, starting_ordinal=starting_ordinal
@@ -659,12 +749,20 @@ class Flow(ABC):
                 **kwargs,
             )
             self.progress_bar.end()
+            config_resolved_future.result()
 
             # Stored until next start()
             self.step_objects += step_objects
 
             return final_state
         finally:
+            if self.progress_bar.started:
+                # Stops the renderer thread if the flow has failed
+                self.progress_bar.end()
+            if config_resolved_future is not None:
+                # Errors are only raised on success so as to not mask the
+                # flow's own, but the write is never left in progress
+                wait([config_resolved_future])
             for registered_handlers in handlers:
                 deregister_additional_handler(registered_handlers)
             if len(warning_handler.warnings):
@@ -672,6 +770,23 @@ class Flow(ABC):
                 for record in warning_handler.warnings.values():
                     warn(f"{record}")
 
+    @staticmethod
+    def __write_if_changed(path: str, content: str):
+        # Skips rewriting files with identical content when resuming runs, and
+        # otherwise replaces them atomically so readers never see partial files
+        try:
+            if os.path.getsize(path) == len(content.encode("utf8")):
+                with open(path, encoding="utf8") as f:
+                    if f.read() == content:
+                        return
+        except FileNotFoundError:
+            pass
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
     @protected
     @abstractmethod
     def run(
@@ -959,7 +1074,7 @@ class Flow(ABC):
                 name = cls.__name__
                 if registered_name is not None:
                     name = registered_name
-                Self.__registry[name] = cls
+                Self.__registry[sys.intern(name)] = cls
                 return cls
 
             return decorator
@@ -973,6 +1088,14 @@ class Flow(ABC):
             """
             return Self.__registry.get(name)
 
+        def __class_getitem__(Self, name: str) -> Optional[Type[Flow]]:
+            """
+            Shorthand for :meth:`get`, i.e., ``Flow.factory["Classic"]``.
+
+            :param name: The registered name of the Flow. Case-sensitive.
+            """
+            return Self.__registry.get(name)
+
         @classmethod
         def list(Self) -> List[str]:
             """
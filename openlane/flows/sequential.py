@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import Future
 from typing import Iterable, List, Set, Tuple, Optional, Type, Dict, Union
 
 from .flow import Flow, FlowException, FlowError
@@ -34,6 +35,10 @@ class SequentialFlow(Flow):
     with nothing happening in parallel and no significant inter-step
     processing.
 
+    Steps are run on OpenLane's global ``ThreadPoolExecutor`` (see
+    :func:`openlane.common.get_tpe`), with the next Step object being set up
+    while the current one is running.
+
     All subclasses of this flow have to do is override the :attr:`.Steps` abstract property
     and it would automatically handle the rest. See `Classic` in Built-in Flows for an example.
 
@@ -52,6 +57,16 @@ class SequentialFlow(Flow):
     :param args: Arguments for :class:`Flow`.
     :param kwargs: Keyword arguments for :class:`Flow`.
 
+    If ``use_cache`` is passed to :meth:`start`, the results of each step are
+    stored in ``runs/.cache`` in the design directory, keyed by the Step's
+    implementation, its configuration and its input state (including the
+    contents of any files referenced by either.) A step with a matching entry
+    is not run again: its step directory is restored from the cache instead
+    (see :meth:`Step.restore`.)
+
+    Please note that the versions of the underlying tools are not part of the
+    key: the cache should be deleted after updating them.
+
     :cvar gating_config_vars: A mapping from step ID (wildcards) to lists of
         Boolean variable names. All Boolean variables must be True for a step with
         a specific ID to execute.
@@ -173,6 +188,7 @@ class SequentialFlow(Flow):
         to: Optional[str] = None,
         skip: Optional[Iterable[str]] = None,
         reproducible: Optional[str] = None,
+        use_cache: bool = False,
         **kwargs,
     ) -> Tuple[State, List[Step]]:
         debug(f"Starting run ▶ '{self.run_dir}'")
@@ -223,6 +239,7 @@ class SequentialFlow(Flow):
 
         executing = frm is None
         deferred_errors = []
+        cache_writes: List[Future[None]] = []
 
         gating_cvars_expanded: Dict[str, List[str]] = {}
         for key, value in self.gating_config_vars.items():
@@ -232,27 +249,33 @@ class SequentialFlow(Flow):
             for id in Filter([key]).filter(step_ids.values()):
                 gating_cvars_expanded[id] = value
 
+        gated_ids: Set[str] = set()
+        for id, gating_cvars in gating_cvars_expanded.items():
+            for variable in gating_cvars:
+                if not self.config[variable]:
+                    gated_ids.add(id)
+
+        # Step objects are only created for steps that actually run, as
+        # setting them up (resolving their configuration, etc.) is not free
         current_state = initial_state
-        for cls in self.Steps:
-            step = cls(config=self.config, state_in=current_state)
-            if frm_resolved is not None and frm_resolved == step.id:
+        prepared_step: Optional[Step] = None
+        for i, cls in enumerate(self.Steps):
+            if frm_resolved is not None and frm_resolved == cls.id:
                 executing = True
 
-            gated = False
-            if gating_cvars := gating_cvars_expanded.get(step.id):
-                for variable in gating_cvars:
-                    if not self.config[variable]:
-                        info(
-                            f"Gating variable for step '{step.id}' set to 'False'- the step will be skipped."
-                        )
-                        gated = True
+            if cls.id in gated_ids:
+                info(
+                    f"Gating variable for step '{cls.id}' set to 'False'- the step will be skipped."
+                )
 
-            self.progress_bar.start_stage(step.name)
+            name = cls.name if hasattr(cls, "name") else cls.__name__
+            self.progress_bar.start_stage(name)
             increment_ordinal = True
-            if not executing or cls.id in skipped_ids or gated:
-                info(f"Skipping step '{step.name}'…")
+            if not executing or cls.id in skipped_ids or cls.id in gated_ids:
+                info(f"Skipping step '{name}'…")
                 increment_ordinal = False
             elif cls.id == reproducible_resolved:
+                step = prepared_step or cls(config=self.config, state_in=current_state)
                 step.create_reproducible(
                     os.path.join(
                         self.dir_for_step(step),
@@ -261,23 +284,67 @@ class SequentialFlow(Flow):
                 )
                 break
             else:
+                step = prepared_step or cls(config=self.config, state_in=current_state)
                 step_list.append(step)
-                try:
-                    current_state = step.start(
-                        toolbox=self.toolbox,
-                        step_dir=self.dir_for_step(step),
+
+                cache_entry: Optional[str] = None
+                restored: Optional[State] = None
+                if use_cache:
+                    cache_entry = os.path.join(
+                        self.__get_cache_dir(), step.get_cache_key()
                     )
+                    restored = step.restore(cache_entry, self.dir_for_step(step))
+
+                state_future: Future[State]
+                if restored is not None:
+                    state_future = Future()
+                    state_future.set_result(restored)
+                else:
+                    state_future = self.start_step_async(step)
+                    if cache_entry is not None:
+                        cache_writes.append(
+                            self.__save_to_cache_when_done(
+                                step, cache_entry, state_future
+                            )
+                        )
+
+                # Set up the next step (config resolution, etc.) while this
+                # one is running. If that fails, it is simply set up again
+                # in the next iteration so errors are reported in order.
+                prepared_step = None
+                if i + 1 < len(self.Steps):
+                    next_cls = self.Steps[i + 1]
+                    if (
+                        (cls.id != to_resolved or next_cls.id == frm_resolved)
+                        and next_cls.id not in skipped_ids
+                        and next_cls.id not in gated_ids
+                    ):
+                        try:
+                            prepared_step = next_cls(
+                                config=self.config,
+                                state_in=state_future,
+                            )
+                        except Exception:
+                            prepared_step = None
+
+                try:
+                    current_state = state_future.result()
                 except StepException as e:
                     raise FlowException(str(e)) from None
                 except DeferredStepError as e:
+                    # The next step must use the last successful state instead
+                    prepared_step = None
                     deferred_errors.append(str(e))
                 except StepError as e:
                     raise FlowError(str(e)) from None
 
             self.progress_bar.end_stage(increment_ordinal=increment_ordinal)
 
-            if to_resolved and to_resolved == step.id:
+            if to_resolved and to_resolved == cls.id:
                 executing = False
+        for cache_write in cache_writes:
+            cache_write.result()
+
         if len(deferred_errors) != 0:
             raise FlowError(
                 "One or more deferred errors were encountered:\n"
@@ -293,3 +360,26 @@ class SequentialFlow(Flow):
             raise FlowException(f"Failed to save final views: {e}")
         success("Flow complete.")
         return (current_state, step_list)
+
+    def __get_cache_dir(self) -> str:
+        return os.path.join(self.design_dir, "runs", ".cache")
+
+    def __save_to_cache_when_done(
+        self,
+        step: Step,
+        cache_entry: str,
+        state_future: Future[State],
+    ) -> Future[None]:
+        # The callback is run by the worker thread after the step's result is
+        # handed off, so copying to the cache overlaps with the next step
+        saved: Future[None] = Future()
+
+        def callback(future: Future[State]):
+            try:
+                if future.exception() is None:
+                    step.save_to_cache(cache_entry)
+            finally:
+                saved.set_result(None)
+
+        state_future.add_done_callback(callback)
+        return saved
@@ -19,13 +19,14 @@ import json
 import time
 import psutil
 import shutil
+import hashlib
 import textwrap
 import datetime
 import subprocess
 from signal import Signals
 from decimal import Decimal
 from io import TextIOWrapper
-from threading import Thread
+from threading import Thread, current_thread
 from inspect import isabstract
 from itertools import zip_longest
 from abc import abstractmethod, ABC
@@ -83,6 +84,40 @@ from ..__version__ import __version__
 
 VT = TypeVar("VT")
 
+_file_digests: Dict[Tuple[str, int, int], str] = {}
+
+
+def _file_digest(path: str) -> str:
+    # Memoized by size and modification time, as the same (large) files, e.g.
+    # PDK libraries, are referenced by the configuration of every step
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if digest := _file_digests.get(key):
+        return digest
+    h = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            h.update(chunk)
+    digest = h.hexdigest()
+    _file_digests[key] = digest
+    return digest
+
+
+def _content_digest(value: Any) -> str:
+    # Files are represented by their name and contents rather than their full
+    # paths so results can be reused across run directories
+    def translator(element):
+        if isinstance(element, Path) and os.path.isfile(element):
+            return f"{os.path.basename(element)}:{_file_digest(str(element))}"
+        return element
+
+    serialized = json.dumps(
+        copy_recursive(value, translator=translator),
+        cls=GenericDictEncoder,
+        sort_keys=True,
+    )
+    return hashlib.blake2b(serialized.encode("utf8"), digest_size=32).hexdigest()
+
 
 class OutputProcessor(ABC, Generic[VT]):
     """
@@ -461,6 +496,8 @@ class Step(ABC):
     state_out: Optional[State] = None
     start_time: Optional[float] = None
     end_time: Optional[float] = None
+    # The thread running :meth:`start`, which may be a thread pool worker
+    _start_thread: Optional[Thread] = None
 
     # These are mutable class variables. However, they will only be used
     # when steps are run outside of a Flow, pretty much.
@@ -1026,6 +1063,130 @@ class Step(ABC):
 
         info(f"Reproducible created at: '{os.path.relpath(target_dir)}'")
 
+    def get_cache_key(self) -> str:
+        """
+        :returns: A key identifying this step's results: a digest of the step's
+            implementation, its configuration and its input state, where files
+            are represented by their names and contents.
+
+            Tool versions are not part of the key.
+        """
+        h = hashlib.blake2b(digest_size=32)
+        for component in [
+            __version__,
+            self.__class__.get_implementation_id(),
+            self.id,
+            _content_digest(self.config.to_raw_dict(include_meta=False)),
+            _content_digest(self.state_in.result().to_raw_dict()),
+        ]:
+            h.update(component.encode("utf8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    @final
+    def restore(self, cache_entry: str, step_dir: str) -> Optional[State]:
+        """
+        Restores the results of a previous execution of this step stored by
+        :meth:`save_to_cache` instead of running it.
+
+        Files are hard-linked from the cache entry into the step directory where
+        possible, and copied otherwise.
+
+        This method is final and should not be subclassed.
+
+        :param cache_entry: The cache entry, typically named after
+            :meth:`get_cache_key`.
+        :param step_dir: The step directory to restore the results into.
+        :returns: The output state, or ``None`` if the entry does not exist.
+        """
+        views_path = os.path.join(cache_entry, "cached_views.json")
+        if not os.path.isfile(views_path):
+            return None
+
+        cached = json.load(open(views_path, encoding="utf8"), parse_float=Decimal)
+        views = copy_recursive(
+            cached["views"],
+            translator=lambda x: (
+                Path(os.path.join(step_dir, x)) if isinstance(x, str) else x
+            ),
+        )
+        state_in = self.state_in.result()
+        state_out = State(state_in, overrides=views, metrics=cached["metrics"])
+
+        def link_or_copy(src: str, dst: str):
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+
+        shutil.copytree(
+            cache_entry,
+            step_dir,
+            copy_function=link_or_copy,
+            dirs_exist_ok=True,
+            ignore=lambda dir, _: (
+                ["cached_views.json", "state_in.json", "state_out.json"]
+                if dir == cache_entry
+                else []
+            ),
+        )
+        with open(os.path.join(step_dir, "state_in.json"), "w") as f:
+            f.write(state_in.dumps())
+        with open(os.path.join(step_dir, "state_out.json"), "w") as f:
+            f.write(state_out.dumps())
+
+        info(f"Restored '{self.id}' from cache.")
+        self.step_dir = step_dir
+        self.state_out = state_out
+        return state_out
+
+    @final
+    def save_to_cache(self, cache_entry: str):
+        """
+        Stores the results of this step so they may be restored using
+        :meth:`restore`. Failures are reported as warnings.
+
+        This method is final and should not be subclassed.
+
+        :param cache_entry: The cache entry, typically named after
+            :meth:`get_cache_key`.
+        """
+        state_in = self.state_in.result()
+        state_out = self.state_out
+        assert state_out is not None, "Attempted to cache a step that did not run"
+
+        # Only the views modified by the step are stored, with paths inside the
+        # step directory made relative to it
+        step_dir = os.path.abspath(self.step_dir)
+        views = {}
+        for key, value in state_out.items():
+            if value != state_in.get(key):
+                views[key] = copy_recursive(
+                    value,
+                    translator=lambda x: (
+                        Path(os.path.relpath(x, step_dir))
+                        if isinstance(x, Path)
+                        and os.path.abspath(x).startswith(step_dir + os.sep)
+                        else x
+                    ),
+                )
+
+        tmp_entry = f"{cache_entry}.tmp"
+        try:
+            mkdirp(os.path.dirname(cache_entry))
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            shutil.copytree(step_dir, tmp_entry)
+            with open(os.path.join(tmp_entry, "cached_views.json"), "w") as f:
+                json.dump(
+                    {"views": views, "metrics": state_out.metrics},
+                    f,
+                    cls=GenericDictEncoder,
+                )
+            os.replace(tmp_entry, cache_entry)
+        except OSError as e:
+            warn(f"Failed to store '{self.id}' in the cache: {e}")
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
     @final
     def start(
         self,
@@ -1066,6 +1227,8 @@ class Step(ABC):
         else:
             self.step_dir = step_dir
 
+        self._start_thread = current_thread()
+
         if toolbox is None:
             if Config.current_interactive is not None:
                 pass
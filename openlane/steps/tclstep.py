@@ -231,9 +231,12 @@ class TclStep(Step):
         **kwargs,
     ) -> Dict[str, Any]:
         if env is not None:
-            thread_postfix = f"_{threading.current_thread().name}"
-            if threading.current_thread() is threading.main_thread():
-                thread_postfix = ""
+            # Only subprocesses run from threads spawned by the step itself
+            # get a separate environment file
+            thread = threading.current_thread()
+            thread_postfix = ""
+            if thread is not (self._start_thread or threading.main_thread()):
+                thread_postfix = f"_{thread.name}"
 
             env_in_dir = report_dir or self.step_dir
             env_in_file = os.path.join(env_in_dir, f"_env{thread_postfix}.tcl")
@@ -204,16 +204,22 @@ def test_copy_recursive_visitor():
 
 
 def test_tpe():
-    from openlane.common import get_tpe, set_tpe
+    from openlane.common import get_tpe, set_tpe, shutdown_tpe
 
     tpe = get_tpe()
     assert tpe._max_workers == os.cpu_count(), "TPE was not initialized properly"
+    assert get_tpe() is tpe, "TPE was not reused"
 
     tpe = ThreadPoolExecutor(1)
     set_tpe(tpe)
 
     assert get_tpe() == tpe, "Failed to set TPE properly"
 
+    shutdown_tpe()
+    with pytest.raises(RuntimeError, match="shutdown"):
+        tpe.submit(print)
+    assert get_tpe() is not tpe, "TPE was not recreated after shutdown"
+
 
 def test_immutable_dict():
     from openlane.common import GenericImmutableDict
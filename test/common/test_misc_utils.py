@@ -34,6 +34,22 @@ def test_slugify():
     ), "Failed slugify test"
 
 
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_mkdirp():
+    import os
+    from openlane.common import mkdirp
+
+    mkdirp(os.path.join("a", "b", "c"))
+    assert os.path.isdir(os.path.join("a", "b", "c")), "Failed to create directories"
+
+    mkdirp(os.path.join("a", "b"))  # Should not fail if it already exists
+
+    with open("file", "w") as f:
+        f.write("")
+    with pytest.raises(FileExistsError):
+        mkdirp("file")
+
+
 def test_magic_drc():
     from openlane.common import DRC, Violation
 
@@ -268,6 +268,33 @@ def test_copy_filtered():
     }, "copy_filtered for step 1 did not work properly"
 
 
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables()
+def test_dumps_memoization():
+    from openlane.config import Config
+
+    cfg, _ = Config.load(
+        {"DESIGN_NAME": "whatever", "VERILOG_FILES": "dir::src/*.v"},
+        config.flow_common_variables,
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+
+    serialized = cfg.dumps()
+    assert cfg.dumps() is serialized, "serialization was not memoized"
+    assert cfg.dumps(indent=2) != serialized, "indent not considered for memoization"
+
+    cfg.meta.flow = "Whatever"
+    assert (
+        cfg.dumps() != serialized
+    ), "memoized serialization not invalidated after meta was modified"
+
+    cfg.meta.flow = ["Whatever", "Else"]
+    assert '"Else"' in cfg.dumps(), "meta with a list of flows failed to serialize"
+
+
 @pytest.mark.usefixtures("_mock_conf_fs")
 @mock_variables()
 def test_with_increment():
@@ -173,6 +173,10 @@ def test_factory(DummyFlow: Type[flow.Flow]):
         Flow.factory.get("Dummy") == DummyFlow
     ), "failed to retrieve registered dummy flow"
 
+    assert (
+        Flow.factory["AnotherName"] == DummyFlow
+    ), "failed to retrieve registered dummy flow using subscript"
+
 
 @pytest.mark.usefixtures("_mock_conf_fs")
 @mock_variables([flow])
@@ -235,24 +239,45 @@ def test_progress_bar(DummyFlow: Type[flow.Flow]):
             self.progress_bar._FlowProgressBar__progress.start_called_count == 1
         ), "start called more than once"
 
+        progress = self.progress_bar._FlowProgressBar__progress
+        render = self.progress_bar._FlowProgressBar__render
+
         self.progress_bar.set_max_stage_count(2)
+        render()
         assert (
-            self.progress_bar._FlowProgressBar__progress.total == 2
+            progress.total == 2
         ), ".set_max_stage_count() failed to set progress bar total"
 
         self.progress_bar.start_stage("literally whatever")
+        render()
+        assert (
+            progress.description == "Dummy - Stage 1 - literally whatever"
+        ), "unexpected stage description"
 
         self.progress_bar.end_stage()
+        render()
+        update_called_count = progress.update_called_count
+        render()
+        assert (
+            progress.update_called_count == update_called_count
+        ), "the same progress snapshot was rendered twice"
 
+        self.progress_bar.start_stage("literally whatever else")
+        render()
         assert (
-            self.progress_bar._FlowProgressBar__progress.update_called_count == 3
-        ), "unexpected progress bar update count"
+            progress.description == "Dummy - Stage 2 - literally whatever else"
+        ), "unexpected stage description"
+
+        assert progress.completed == 1, "task complete count out of sync"
 
         assert (
-            self.progress_bar._FlowProgressBar__progress.completed == 1
-        ), "task complete count out of sync"
+            self.progress_bar.get_ordinal_prefix() == "2-"
+        ), "incorrect ordinal returned"
 
-        self.progress_bar.get_ordinal_prefix() == "2-", "incorrect ordinal returned"
+        self.progress_bar.set_max_stage_count(10)
+        assert (
+            self.progress_bar.get_ordinal_prefix() == "02-"
+        ), "ordinal not padded to the number of digits of the maximum stage"
 
         return initial_state.copy(), []
 
@@ -272,6 +297,63 @@ def test_progress_bar(DummyFlow: Type[flow.Flow]):
     flow.start()
 
 
+def test_disabled_progress_bar():
+    from openlane.logging import options
+    from openlane.flows import FlowProgressBar
+
+    show_progress_bar = options.get_show_progress_bar()
+    options.set_show_progress_bar(False)
+    try:
+        progress_bar = FlowProgressBar("Dummy")
+    finally:
+        options.set_show_progress_bar(show_progress_bar)
+
+    progress_bar.start()
+    assert (
+        progress_bar._FlowProgressBar__renderer is None
+    ), "renderer thread started for a disabled progress bar"
+
+    progress_bar.set_max_stage_count(1)
+    progress_bar.start_stage("literally whatever")
+    progress_bar.end()
+    progress = progress_bar._FlowProgressBar__progress
+    assert (
+        progress.description == "Dummy - Stage 1 - literally whatever"
+    ), "end() did not render the final progress"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow])
+def test_failed_run_resolved_config(DummyFlow: Type[flow.Flow]):
+    from openlane.flows import FlowException
+
+    def run_override(self: DummyFlow, initial_state, **kwargs):
+        raise FlowException("run failed")
+
+    flow = DummyFlow(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "DUMMY_VARIABLE": "PINGAS",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+        run_override=run_override,
+    )
+
+    with pytest.raises(FlowException, match="run failed"):
+        flow.start(tag="FAILED")
+
+    assert os.path.isfile(
+        "/cwd/runs/FAILED/resolved.json"
+    ), "failed run did not finish writing the resolved configuration"
+    assert not os.path.exists(
+        "/cwd/runs/FAILED/resolved.json.tmp"
+    ), "failed run left a temporary file behind"
+
+
 @pytest.mark.usefixtures("_mock_conf_fs")
 @mock_variables([flow, step])
 def test_run_tags(caplog: pytest.LogCaptureFixture, MockStepTuple):
@@ -318,6 +400,12 @@ def test_run_tags(caplog: pytest.LogCaptureFixture, MockStepTuple):
     caplog.clear()
 
     flow.start(tag="MY_TAG2")
+    assert os.path.isfile(
+        os.path.join(flow.run_dir, "resolved.json")
+    ), ".start() did not write the resolved configuration"
+    assert not any(
+        entry.endswith(".tmp") for entry in os.listdir(flow.run_dir)
+    ), ".start() left a temporary file behind"
     caplog.clear()
 
     state = flow.start(tag="MY_TAG2")
@@ -339,3 +427,7 @@ def test_run_tags(caplog: pytest.LogCaptureFixture, MockStepTuple):
         FlowException, match="already exists as a file and not a directory"
     ):
         flow.start(tag="MY_TAG3")
+    assert flow.toolbox is None, "reference to the previous toolbox was not destroyed"
+    assert (
+        flow.config_resolved_path is None
+    ), "reference to the previous resolved configuration was not destroyed"
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 from typing import Type
 
 import pytest
@@ -227,25 +228,32 @@ def test_bad_substitution(MetricIncrementer):
 def test_flow_control(MetricIncrementer):
     from openlane.flows import SequentialFlow
 
-    class OtherMetricIncrementer(MetricIncrementer):
+    instantiated = []
+
+    class TrackedMetricIncrementer(MetricIncrementer):
+        def __init__(self, *args, **kwargs):
+            instantiated.append(self.id)
+            super().__init__(*args, **kwargs)
+
+    class OtherMetricIncrementer(TrackedMetricIncrementer):
         id = "Test.OtherMetricIncrementer"
         counter_name = "other_counter"
 
-    class AnotherMetricIncrementer(MetricIncrementer):
+    class AnotherMetricIncrementer(TrackedMetricIncrementer):
         id = "Test.AnotherMetricIncrementer"
         counter_name = "another_counter"
 
-    class YetAnotherMetricIncrementer(MetricIncrementer):
+    class YetAnotherMetricIncrementer(TrackedMetricIncrementer):
         id = "Test.YetAnotherMetricIncrementer"
         counter_name = "yet_another_counter"
 
-    class LastMetricIncrementer(MetricIncrementer):
+    class LastMetricIncrementer(TrackedMetricIncrementer):
         id = "Test.LastMetricIncrementer"
         counter_name = "last_another_counter"
 
     class Dummy(SequentialFlow):
         Steps = [
-            MetricIncrementer,
+            TrackedMetricIncrementer,
             OtherMetricIncrementer,
             AnotherMetricIncrementer,
             YetAnotherMetricIncrementer,
@@ -271,6 +279,10 @@ def test_flow_control(MetricIncrementer):
         "other_counter",
         "yet_another_counter",
     ], "flow control did not yield the expected results"
+    assert instantiated == [
+        "Test.OtherMetricIncrementer",
+        "Test.YetAnotherMetricIncrementer",
+    ], "skipped steps were instantiated"
 
 
 @pytest.mark.usefixtures("_mock_conf_fs")
@@ -348,3 +360,147 @@ def test_gating_validation(MetricIncrementer):
 
         class _Test2(Dummy):
             gating_config_vars = {"Test.MetricIncrementer": ["BAD_GATING_VARIABLE"]}
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_deferred_errors(MetricIncrementer):
+    from openlane.flows import SequentialFlow, FlowError
+    from openlane.steps import DeferredStepError
+
+    class DeferredFailure(MetricIncrementer):
+        id = "Test.DeferredFailure"
+
+        def run(self, state_in, **kwargs):
+            raise DeferredStepError("deferred failure")
+
+    class Dummy(SequentialFlow):
+        Steps = [
+            MetricIncrementer,
+            DeferredFailure,
+            MetricIncrementer,
+        ]
+
+    flow = Dummy(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+
+    with pytest.raises(FlowError, match="deferred failure"):
+        flow.start()
+
+    import glob
+    from openlane.state import State
+
+    (final_state_path,) = glob.glob(os.path.join(flow.run_dir, "3-*", "state_out.json"))
+    final_state = State.loads(open(final_state_path, encoding="utf8").read())
+    assert (
+        final_state.metrics["counter"] == 2
+    ), "step after a deferred error did not run with the last successful state"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_step_cache():
+    from openlane.common import Path
+    from openlane.flows import SequentialFlow
+    from openlane.state import DesignFormat
+
+    runs = []
+
+    class FileWriter(Step):
+        id = "Test.FileWriter"
+        inputs = []
+        outputs = [DesignFormat.JSON_HEADER]
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            out_file = os.path.join(self.step_dir, "out.json")
+            with open(out_file, "w", encoding="utf8") as f:
+                f.write("{}")
+            return {DesignFormat.JSON_HEADER: Path(out_file)}, {"written": True}
+
+    class Dummy(SequentialFlow):
+        Steps = [FileWriter]
+
+    flow = Dummy(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+
+    flow.start(tag="NO_CACHE")
+    flow.start(tag="CACHE_1", use_cache=True)
+    state = flow.start(tag="CACHE_2", use_cache=True)
+    assert runs == [
+        "Test.FileWriter",
+        "Test.FileWriter",
+    ], "step was not restored from the cache"
+    assert state[DesignFormat.JSON_HEADER] == os.path.join(
+        flow.run_dir, "1-test-filewriter", "out.json"
+    ), "restored state does not point to the new step directory"
+    assert os.path.isfile(
+        state[DesignFormat.JSON_HEADER]
+    ), "restored step directory is missing outputs"
+    assert state.metrics["written"], "restored state is missing metrics"
+
+    with open("/cwd/src/a.v", "w", encoding="utf8") as f:
+        f.write("module a; endmodule")
+
+    flow.start(tag="CACHE_3", use_cache=True)
+    assert len(runs) == 3, "modified input file did not invalidate the cache"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_tclstep_env_file():
+    from unittest import mock
+
+    from openlane.flows import SequentialFlow
+    from openlane.steps import TclStep
+
+    class TclStepTest(TclStep):
+        id = "Test.TclStep"
+        inputs = []
+        outputs = []
+
+        def get_script_path(self):
+            return "/dummy_path"
+
+    class Dummy(SequentialFlow):
+        Steps = [TclStepTest]
+
+    flow = Dummy(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+
+    with mock.patch.object(
+        step_module.Step,
+        "run_subprocess",
+        return_value={"generated_metrics": {}},
+    ):
+        flow.start()
+
+    assert sorted(
+        entry
+        for entry in os.listdir(flow.step_objects[0].step_dir)
+        if entry.startswith("_env")
+    ) == ["_env.tcl"], "step running on a thread pool worker wrote a suffixed _env file"
@@ -255,6 +255,50 @@ def test_step_start(mock_config):
     }, "Wrong step state_out metrics"
 
 
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([step])
+def test_step_cache(mock_config):
+    from openlane.common import Path
+    from openlane.common import Toolbox
+    from openlane.state import DesignFormat, State
+    from openlane.steps import Step, MetricsUpdate, ViewsUpdate
+
+    class TestStep(Step):
+        inputs = []
+        outputs = [DesignFormat.NETLIST]
+        id = "TestStep"
+
+        def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
+            out_file = os.path.join(self.step_dir, "out.nl.v")
+            with open(out_file, "w") as f:
+                f.write("\n")
+            return {DesignFormat.NETLIST: Path(out_file)}, {"metric": 1}
+
+    step = TestStep(config=mock_config, state_in=State())
+    cache_entry = os.path.join("/cwd", "cache", step.get_cache_key())
+    assert (
+        step.restore(cache_entry, "/cwd/miss") is None
+    ), "missing cache entry did not return None"
+
+    step.start(toolbox=Toolbox(tmp_dir="/cwd/tmp"), step_dir="/cwd/a")
+    step.save_to_cache(cache_entry)
+
+    restored_step = TestStep(config=mock_config, state_in=State())
+    assert (
+        restored_step.get_cache_key() == step.get_cache_key()
+    ), "identical steps have different cache keys"
+    state_out = restored_step.restore(cache_entry, "/cwd/b")
+    assert state_out is not None, "step was not restored from the cache"
+    assert (
+        state_out[DesignFormat.NETLIST] == "/cwd/b/out.nl.v"
+    ), "restored state does not point to the new step directory"
+    assert state_out.metrics["metric"] == 1, "restored state is missing metrics"
+    assert os.path.isfile("/cwd/b/state_out.json"), "restored state was not written"
+    assert not os.path.exists(
+        "/cwd/b/cached_views.json"
+    ), "cache metadata leaked into the step directory"
+
+
 @pytest.mark.usefixtures("_mock_conf_fs")
 @mock_variables([step])
 def test_step_longname(mock_run, mock_config):